@@ -0,0 +1,15 @@
+_display = None  # IPython's display(), imported on first debug use
+
+
+def _debug_draw(circuit):
+    """
+    Render a circuit with matplotlib and show it through IPython's `display()`.
+
+    IPython is imported lazily on the first call and the `display` reference is cached,
+    so importing `qutilities` never pulls in IPython or matplotlib.
+    """
+    global _display
+    if _display is None:
+        from IPython.display import display
+        _display = display
+    _display(circuit.draw('mpl'))
@@ -1,6 +1,12 @@
+from functools import lru_cache
+import numpy as np
 from qiskit import QuantumCircuit, QuantumRegister
-from qutilities.qft import QFT, QFTGate
-from math import pi
+from qiskit.circuit import Gate
+from qiskit.circuit.library import CPhaseGate, DiagonalGate, PhaseGate
+from qiskit.quantum_info import Statevector
+from qutilities.qft import qft as _qft
+from qutilities.qft.qft import _cached_qft_gate
+from qutilities._debug import _debug_draw
 
 class QFTAdder:
     """
@@ -37,11 +43,23 @@ class QFTAdder:
     insert_barrier : bool, default=False
         If True, inserts visual barriers between logical blocks.
 
+    scale : int, default=1
+        Integer weight applied to the operand, i.e. X ← X ± scale·A. All phase angles are
+        pre-multiplied by `scale`, so a single adder replaces `scale` repeated applications.
+
+    constant : int, optional
+        Classical value to add in place of an operand register (X ← X ± constant).
+        Mutually exclusive with `operand`; see `QFTAdder.from_constant`.
+
+    precision : float, default=0.0
+        Phase rotations with |angle| below this threshold are dropped (approximate adder).
+        The default keeps every rotation.
+
     Example
     -------
     >>> X = QuantumRegister(4, 'X')
     >>> A = QuantumRegister(3, 'A')
-    >>> adder = QFTAdder(X=X, A=A, inverse=False)
+    >>> adder = QFTAdder(target=X, operand=A, inverse=False)
     >>> qc = adder.build()
 
     References
@@ -49,6 +67,9 @@ class QFTAdder:
     - T.G. Draper, "Addition on a Quantum Computer", arXiv:quant-ph/0008033
       https://arxiv.org/abs/quant-ph/0008033
     """
+    __slots__ = ('X_reg', 'A_reg', 'constant', 'subtract', 'skip_qft', 'label', 'debug',
+                 'insert_barrier', 'scale', 'precision', '_angles', 'adder_circuit')
+
     def __init__(self, 
                  target: QuantumRegister,
                  operand: QuantumRegister,
@@ -56,36 +77,195 @@ class QFTAdder:
                  skip_qft=False,                 
                  label: str | None = None,
                  debug: bool = False,
-                 insert_barrier: bool = False):
+                 insert_barrier: bool = False,
+                 scale: int = 1,
+                 constant: int | None = None,
+                 precision: float = 0.0):
 
-        if target is None or operand is None:
+        if target is None or (operand is None and constant is None):
             raise ValueError("Both target and operand registers must be provided.")
-            
-        
-        if target.size <= operand.size:
+
+        if operand is not None and constant is not None:
+            raise ValueError("[!] Provide either an operand register or a classical constant, not both.")
+
+        if operand is not None and target.size <= operand.size:
             raise ValueError("[!] Target register must be at least one qubit longer than operand register, to hold overflow.")
+
+        if precision < 0:
+            raise ValueError("[!] Precision must be non-negative.")
         
         self.X_reg = target
         self.A_reg = operand
+        self.constant = constant
         self.subtract = inverse
         self.skip_qft = skip_qft
-        self.label = label or ('|X-A⟩' if self.subtract else '|X+A⟩')
+        operand_label = 'A' if constant is None else str(constant)
+        self.label = label or (f'|X-{operand_label}⟩' if self.subtract else f'|X+{operand_label}⟩')
         self.debug = debug
         self.insert_barrier = insert_barrier
+        self.scale = scale
+        self.precision = precision
+
+        # Draper angles form a fixed geometric schedule: angle(d) = ±scale·π / 2^d, wrapped
+        # into (-π, π] so that multiples of 2π (identities when scale > 1) become exactly 0.
+        # The wrap is done on the dyadic multiplier of π, where it is exact.
+        sign = -1.0 if self.subtract else 1.0
+        turns = sign * self.scale * np.ldexp(1.0, -np.arange(self.X_reg.size, dtype=np.int64))
+        self._angles = np.pi * (1.0 - np.remainder(1.0 - turns, 2.0))
+        # Angles below the precision threshold are pruned (zeroed) everywhere they are used
+        self._angles[np.abs(self._angles) < self.precision] = 0.0
+
+    @classmethod
+    def from_AB(cls,
+                num_qubits: int,
+                A: QuantumRegister | None = None,
+                B: QuantumRegister | None = None,
+                **kwargs):
+        """
+        Construct an adder using the legacy A/B register convention: B ← B ± A.
+
+        Maps onto the canonical constructor with `target=B` and `operand=A`. Missing
+        registers are created: A with `num_qubits` qubits and B with `num_qubits + 1`
+        qubits, so that B can hold the overflow.
+
+        Parameters
+        ----------
+        num_qubits : int
+            Width of the operand register A.
+
+        A : QuantumRegister, optional
+            Operand register. Created as `QuantumRegister(num_qubits, 'A')` if omitted.
+
+        B : QuantumRegister, optional
+            Target register. Created as `QuantumRegister(num_qubits + 1, 'B')` if omitted.
+
+        **kwargs
+            Remaining keyword arguments forwarded to `QFTAdder.__init__`.
+
+        Returns
+        -------
+        QFTAdder
+            Adder instance acting as B ← B ± A.
+        """
+        if num_qubits is None or num_qubits < 1:
+            raise ValueError("[!] Number of qubits must be a positive integer.")
+
+        A = A if A is not None else QuantumRegister(num_qubits, 'A')
+        B = B if B is not None else QuantumRegister(num_qubits + 1, 'B')
+        return cls(target=B, operand=A, **kwargs)
+
+    @classmethod
+    def from_constant(cls,
+                      target: QuantumRegister,
+                      constant: int,
+                      inverse: bool = False,
+                      **kwargs):
+        """
+        Construct an adder for a classically known operand: X ← X ± constant.
+
+        With the operand fixed at build time, every CP gate of the Draper adder collapses
+        into single-qubit phase gates: X[j] receives P(θ_j) with
+        θ_j = Σ_{k≤j} c_k · π / 2^(j-k), where c_k are the bits of `constant`
+        (Beauregard's ΦADD). No operand register and no two-qubit gates are needed.
+
+        Parameters
+        ----------
+        target : QuantumRegister
+            Register that holds the input and receives the result.
+
+        constant : int
+            Classical value to add (or subtract); taken modulo 2^len(target).
+
+        inverse : bool, default=False
+            If True, subtracts the constant instead of adding it.
+
+        **kwargs
+            Remaining keyword arguments forwarded to `QFTAdder.__init__`.
+
+        Returns
+        -------
+        QFTAdder
+            Adder instance acting on `target` only.
+
+        References
+        ----------
+        - S. Beauregard, "Circuit for Shor's algorithm using 2n+3 qubits", arXiv:quant-ph/0205095
+        """
+        if constant is None:
+            raise ValueError("[!] A classical constant must be provided.")
+        return cls(target=target, operand=None, inverse=inverse, constant=int(constant), **kwargs)
+
+    @classmethod
+    def build_many(cls,
+                   specs: list[tuple[int, bool]],
+                   target: QuantumRegister,
+                   **kwargs) -> list[Gate]:
+        """
+        Build several constant adders on the same target register in one batch.
+
+        Equivalent to `[QFTAdder.from_constant(target, c, inverse=s, **kwargs).build().to_gate()
+        for c, s in specs]`, but the per-qubit phases of all adders with the same sign come
+        from a single matrix product, and `PhaseGate` objects are shared between adders
+        that use the same angle.
+
+        Parameters
+        ----------
+        specs : list of (int, bool)
+            One `(constant, inverse)` pair per adder; `inverse=True` subtracts the constant.
+
+        target : QuantumRegister
+            Register that every adder acts on.
+
+        **kwargs
+            Remaining keyword arguments forwarded to `QFTAdder.__init__` for every adder
+            (e.g. `skip_qft`, `scale`, `precision`). `insert_barrier` is ignored, since
+            barriers are not allowed in gates.
+
+        Returns
+        -------
+        list of Gate
+            One gate per spec, in the order given.
+        """
+        kwargs['insert_barrier'] = False  # Barriers not allowed in gates
+        adders = [cls.from_constant(target, constant, inverse=inverse, **kwargs) for constant, inverse in specs]
+
+        # Adders of one sign share an angle table, so their phases come from one product
+        phases = [None] * len(adders)
+        for subtract in (False, True):
+            group = [k for k, adder in enumerate(adders) if adder.subtract == subtract]
+            if not group:
+                continue
+            first = adders[group[0]]
+            bits = _constant_bits([adders[k].constant for k in group], target.size)
+            for k, row in zip(group, _constant_phase_table(first._angles, bits, first.precision)):
+                phases[k] = row
+
+        phase_gates = {}
+        gates = []
+        for adder, row in zip(adders, phases):
+            adder._create_circuit()
+            adder._apply_qft()
+            adder._append_phase_gates(row, phase_gates)
+            adder._apply_iqft()
+            gates.append(adder.adder_circuit.to_gate())
+        return gates
 
     def _create_circuit(self):
         """
         Create the underlying QuantumCircuit object, using provided external registers.
         """
-        self.adder_circuit = QuantumCircuit(self.X_reg, self.A_reg, name=self.label)
+        if self.A_reg is None:
+            self.adder_circuit = QuantumCircuit(self.X_reg, name=self.label)
+        else:
+            self.adder_circuit = QuantumCircuit(self.X_reg, self.A_reg, name=self.label)
 
     def _debug_display(self):
         """
         Display the current state of the circuit using matplotlib if debug mode is enabled.
         """
-        if self.debug:
-            from IPython.display import display
-            display(self.adder_circuit.draw('mpl'))
+        if not self.debug:
+            return
+        _debug_draw(self.adder_circuit)
 
     def _insert_barrier(self):
         """
@@ -103,7 +283,7 @@ class QFTAdder:
         Gate
             QFT gate object to be applied on register X.
         """
-        return QFTGate(num_qubits=self.X_reg.size).build()
+        return _cached_qft_gate(self.X_reg.size, inverse=False)
 
     def _create_iqft_gate(self):
         """
@@ -114,7 +294,7 @@ class QFTAdder:
         Gate
             Inverse QFT gate object to be applied on register X.
         """
-        return QFTGate(num_qubits=self.X_reg.size, inverse=True).build()
+        return _cached_qft_gate(self.X_reg.size, inverse=True)
 
     def _apply_qft(self):
         """
@@ -135,61 +315,249 @@ class QFTAdder:
         iqft_gate = self._create_iqft_gate()
         self.adder_circuit.append(iqft_gate, self.X_reg)
 
-    def _encode_angle(self, distance: int) -> float:
+    def _constant_angles(self) -> np.ndarray:
         """
-        Compute the Draper phase angle based on the qubit distance.
-        The angle is negated if subtraction mode is enabled.
-
-        Parameters
-        ----------
-        distance : int
-            Distance between target and control qubit indices.
+        Compute the single-qubit phase θ_j applied to X[j] for a classical constant operand.
 
         Returns
         -------
-        float
-            The encoded phase angle in radians.
+        np.ndarray
+            Array of length |X| with θ_j = Σ_{k≤j} c_k · angle(j-k); phases below
+            `precision` are set to zero.
         """
-        angle = pi / (2 ** distance)
-        return -angle if self.subtract else angle
+        bits = _constant_bits([self.constant], self.X_reg.size)
+        return _constant_phase_table(self._angles, bits, self.precision)[0]
 
-    def _apply_phase_kick(self, control_idx: int, target_idx: int):
+    def _append_phase_gates(self, phases: np.ndarray, phase_gates: dict):
         """
-        Apply a single controlled phase rotation from A[control_idx] to X[target_idx].
+        Append one phase gate per X qubit, followed by a barrier (if enabled).
+        Qubits with a zero (or pruned) phase are left untouched.
 
         Parameters
         ----------
-        control_idx : int
-            Index of the control qubit in register A.
-        target_idx : int
-            Index of the target qubit in register X.
+        phases : np.ndarray
+            Phase θ_j for each qubit X[j].
+        phase_gates : dict
+            Pool of `PhaseGate` objects keyed by angle, shared between circuits.
         """
-        distance = target_idx - control_idx
-        angle = self._encode_angle(distance)
-        self.adder_circuit.cp(angle, self.A_reg[control_idx], self.X_reg[target_idx])
+        append = self.adder_circuit._append
+        for qubit, angle in zip(self.X_reg, phases.tolist()):
+            if angle != 0.0:
+                if angle not in phase_gates:
+                    phase_gates[angle] = PhaseGate(angle)
+                append(phase_gates[angle], (qubit,), ())
+        self._insert_barrier()
+
+    def _apply_constant_phases(self):
+        """
+        Apply one phase gate per X qubit for a classical constant operand.
+        """
+        self._append_phase_gates(self._constant_angles(), {})
 
     def _apply_phase_kickbacks(self):
         """
         Apply all necessary Draper-style CP gates from register A to X.
-        For each A[i], apply CP to X[i..n], followed by a barrier (if enabled).
+        For a classical constant operand, single-qubit phase gates are applied instead.
+
+        Gates are emitted in batches of equal distance d = target - control, so each batch
+        shares a single angle and acts on disjoint qubit pairs (one moment per batch).
+        All CP gates are diagonal and commute, so the ordering does not change the unitary.
+        A barrier follows each batch (if enabled).
+
+        Batches whose angle is zero are skipped: these are identities (multiples of 2π for
+        scale > 1) or rotations pruned by `precision`. All CPs of a batch share one `CPhaseGate`
+        instance, appended through the unchecked `_append` path (qubits are known to be valid).
         """
-        for control_qubit in range(self.A_reg.size):
-            for target_qubit in range(control_qubit, self.X_reg.size):
-                self._apply_phase_kick(control_qubit, target_qubit)
+        if self.A_reg is None:
+            self._apply_constant_phases()
+            return
+
+        # Hot loop: bind the append method and qubit lists once instead of per CP gate
+        append = self.adder_circuit._append
+        x_qubits, a_qubits = list(self.X_reg), list(self.A_reg)
+        n_X, n_A = len(x_qubits), len(a_qubits)
+
+        for distance, angle in enumerate(self._angles.tolist()):
+            if angle == 0.0:
+                continue
+            gate = CPhaseGate(angle)
+            for control_qubit in range(min(n_A, n_X - distance)):
+                append(gate, (a_qubits[control_qubit], x_qubits[control_qubit + distance]), ())
             self._insert_barrier()
 
+    def _apply_stages(self):
+        """
+        Apply the QFT, phase-kickback and inverse QFT stages to the current circuit.
+        With `skip_qft=True` only the phase kickbacks are applied.
+        """
+        if self.skip_qft:
+            # Fourier-basis fast path (e.g. inner adders of QFTMultiplier)
+            self._apply_phase_kickbacks()
+        else:
+            self._apply_qft()
+            self._apply_phase_kickbacks()
+            self._apply_iqft()
+
     def build(self):
         """
         Construct and return the full Draper QFT adder circuit.
 
+        For a register operand the gate sequence depends only on the register sizes and
+        flags, so it is taken from a cached template (see `_adder_template`) and composed
+        onto this adder's registers instead of being regenerated. Constant adders emit at
+        most |X| phase gates and rarely repeat, so they are built directly.
+
         Returns
         -------
         QuantumCircuit
             A complete quantum circuit implementing X ± A → X.
         """
         self._create_circuit()
-        self._apply_qft()
-        self._apply_phase_kickbacks()
-        self._apply_iqft()
+        if self.A_reg is None:
+            self._apply_stages()
+        else:
+            fuse_qft = not self.skip_qft and self.X_reg.size <= _qft.FUSE_THRESHOLD
+            template = _adder_template(self.X_reg.size, self.A_reg.size, self.subtract,
+                                       self.skip_qft, self.scale, self.insert_barrier,
+                                       self.precision, fuse_qft)
+            self.adder_circuit.compose(template, qubits=self.adder_circuit.qubits, inplace=True)
         self._debug_display()
         return self.adder_circuit
+
+    def _diagonal_phases(self) -> np.ndarray:
+        """
+        Compute the diagonal of the Fourier-basis phase-kickback stage.
+
+        The kickback stage is diagonal in the computational basis of X⊕A: basis state |x⟩|a⟩
+        acquires the phase Σ_{c≤t} a_c · x_t · angle(t-c), where angle(d) is the (possibly
+        pruned) Draper angle at distance d.
+
+        For a classical constant operand the diagonal acts on X alone, with phase
+        Σ_t x_t · θ_t.
+
+        Returns
+        -------
+        np.ndarray
+            Complex phase vector of length 2^(|X|+|A|), ordered as Qiskit basis indices
+            (X on the low-order qubits).
+        """
+        n_X = self.X_reg.size
+        t = np.arange(n_X)
+        x_bits = (np.arange(2 ** n_X)[None, :] >> t[:, None]) & 1
+        if self.A_reg is None:
+            return np.exp(1j * (self._constant_angles() @ x_bits))
+
+        c = np.arange(self.A_reg.size)
+        a_bits = (np.arange(2 ** c.size)[:, None] >> c[None, :]) & 1
+        distance = t[None, :] - c[:, None]
+        weights = np.where(distance >= 0, self._angles[np.maximum(distance, 0)], 0.0)
+        phases = a_bits @ weights @ x_bits
+        return np.exp(1j * phases).ravel()
+
+    def build_diagonal(self, controlled: bool = False) -> DiagonalGate:
+        """
+        Build the Fourier-basis phase-kickback stage as a single diagonal gate.
+
+        The returned gate acts on the qubits of X followed by A and is equivalent to
+        `build()` with `skip_qft=True`, but replaces the O(n²) CP gates with one
+        precomputed diagonal. It is intended for small registers on simulators.
+
+        Parameters
+        ----------
+        controlled : bool, default=False
+            If True, the gate takes one extra control qubit after A; the phases are only
+            applied when it is |1⟩. A controlled diagonal is still diagonal, so no
+            `ControlledGate` wrapper is needed.
+
+        Returns
+        -------
+        DiagonalGate
+            Diagonal gate implementing X ± A → X in the Fourier basis of X.
+        """
+        phases = self._diagonal_phases()
+        if controlled:
+            phases = np.concatenate([np.ones_like(phases), phases])
+        return DiagonalGate(phases.tolist())
+
+    def apply_to_statevector(self, statevector):
+        """
+        Apply the Fourier-basis phase-kickback stage in place to a state vector.
+
+        Parameters
+        ----------
+        statevector : np.ndarray or Statevector
+            Complex amplitudes over the qubits of X followed by A (X on the low-order qubits),
+            with X already in the Fourier basis.
+
+        Returns
+        -------
+        np.ndarray or Statevector
+            The same object, with its amplitudes multiplied by the adder's phases.
+
+        Raises
+        ------
+        ValueError
+            If the amplitudes are not complex or do not match the adder's width.
+        """
+        if isinstance(statevector, Statevector):
+            data = statevector.data
+        else:
+            statevector = data = np.asarray(statevector)
+
+        if not np.iscomplexobj(data):
+            raise ValueError(f"[!] State vector must have a complex dtype, got {data.dtype}.")
+
+        phases = self._diagonal_phases()
+        if data.shape != phases.shape:
+            raise ValueError(f"[!] State vector must have {phases.size} amplitudes, got {data.size}.")
+        np.multiply(data, phases, out=data)
+        return statevector
+
+
+def _constant_bits(constants: list[int], num_qubits: int) -> np.ndarray:
+    """
+    Return the little-endian bits of each constant modulo 2^num_qubits, one row per constant.
+    """
+    modulus = 1 << num_qubits
+    return np.array([[((int(constant) % modulus) >> k) & 1 for k in range(num_qubits)]
+                     for constant in constants], dtype=float).reshape(len(constants), num_qubits)
+
+
+def _constant_phase_table(angles: np.ndarray, bits: np.ndarray, precision: float = 0.0) -> np.ndarray:
+    """
+    Compute Beauregard ΦADD phases for a batch of classical constants.
+
+    Row s holds θ_j = Σ_{k≤j} bits[s, k] · angles[j-k] for every target qubit j, i.e. the
+    bit matrix times an upper Toeplitz table of Draper angles. Phases below `precision`
+    are set to zero.
+    """
+    distance = np.arange(angles.size)
+    offsets = distance[None, :] - distance[:, None]
+    toeplitz = np.where(offsets >= 0, angles[np.maximum(offsets, 0)], 0.0)
+    phases = bits @ toeplitz
+    phases[np.abs(phases) < precision] = 0.0
+    return phases
+
+
+@lru_cache(maxsize=256)
+def _adder_template(n_X: int, n_A: int, subtract: bool, skip_qft: bool,
+                    scale: int = 1, insert_barrier: bool = False,
+                    precision: float = 0.0, fuse_qft: bool = False) -> QuantumCircuit:
+    """
+    Return the shared Draper adder circuit (register operand) for the given sizes and flags.
+
+    The template is built once on placeholder registers and must not be mutated;
+    `QFTAdder.build()` composes it onto the caller's registers. `fuse_qft` only keys the
+    cache, so templates follow changes to `qutilities.qft.qft.FUSE_THRESHOLD`. The cache is
+    bounded because `scale` and `precision` make the key space open-ended.
+    """
+    adder = QFTAdder(target=QuantumRegister(n_X, 'X'),
+                     operand=QuantumRegister(n_A, 'A'),
+                     inverse=subtract,
+                     skip_qft=skip_qft,
+                     insert_barrier=insert_barrier,
+                     scale=scale,
+                     precision=precision)
+    adder._create_circuit()
+    adder._apply_stages()
+    return adder.adder_circuit
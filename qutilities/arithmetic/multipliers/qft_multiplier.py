@@ -1,6 +1,13 @@
+import numpy as np
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from qutilities.qft import QFTGate
+from qiskit.circuit.library import UnitaryGate
+from qutilities.qft.qft import _cached_qft_gate
 from qutilities.arithmetic.adders.qft_adder import QFTAdder
+from qutilities._debug import _debug_draw
+
+# Widest (Y, M, control) span for which `use_diagonal=True` is accepted; the
+# diagonal has 2^width entries per multiplier bit.
+MAX_DIAGONAL_QUBITS = 16
 
 class QFTMultiplier:
     """
@@ -19,9 +26,12 @@ class QFTMultiplier:
     -----
     This class accumulates phase rotations in the QFT domain and is fully quantum-coherent,
     supporting inputs in superposition. The logic scales linearly with the control register size,
-    using repeated controlled additions for each binary-weighted contribution of N[i].
+    using one controlled addition per bit N[i], with the binary weight 2^i folded into its phase angles.
     When `inverse=True`, the operation becomes subtraction: Y ← Y − M × N.
     """
+    __slots__ = ('M_reg', 'N_reg', 'Y_reg', 'inverse', 'skip_qft', 'debug', 'insert_barrier',
+                 'label', 'precision', 'use_diagonal', '_c_add_gates', 'multiplier_circuit')
+
     def __init__(
         self,
         multiplicand: QuantumRegister, # Value to be multiplied (M)
@@ -32,6 +42,8 @@ class QFTMultiplier:
         insert_barrier: bool = False,
         debug: bool = False,
         label: str | None = None,
+        precision: float = 0.0,
+        use_diagonal: bool = False,
     ):
         """
         Initialize a QFT-based multiplier instance.
@@ -61,6 +73,21 @@ class QFTMultiplier:
     
         label : str, optional
             Optional label used to name the resulting circuit.
+
+        precision : float, optional
+            Phase rotations of the inner adders with |angle| below this threshold are
+            dropped. Default is 0.0 (exact).
+
+        use_diagonal : bool, optional
+            If True, each weighted controlled adder is emitted as one `DiagonalGate` over
+            (Y, M, N[i]) instead of controlled CP gates. The diagonal has 2^(|Y|+|M|+1)
+            entries, so this only suits small registers on simulators. Default is False.
+
+        Raises
+        ------
+        ValueError
+            If `target` is too small, or if `use_diagonal=True` and |Y|+|M|+1 exceeds
+            `MAX_DIAGONAL_QUBITS`.
         """
         """
         Initialize a QFT-based multiplier instance.
@@ -110,6 +137,18 @@ class QFTMultiplier:
         self.debug = debug
         self.insert_barrier = insert_barrier
         self.label = label or ("|M×N⟩" if not inverse else "|M÷N⟩")
+        self.precision = precision
+        self.use_diagonal = use_diagonal
+
+        diagonal_width = self.Y_reg.size + self.M_reg.size + 1
+        if self.use_diagonal and diagonal_width > MAX_DIAGONAL_QUBITS:
+            raise ValueError(
+                f'[!] use_diagonal=True needs a {diagonal_width}-qubit diagonal (2^{diagonal_width} entries) per multiplier bit,\n'
+                f'    above the limit of {MAX_DIAGONAL_QUBITS} qubits. Use the default CP-based construction (use_diagonal=False).'
+            )
+
+        # Controlled adders keyed by their binary weight (scale)
+        self._c_add_gates = {}
 
     def _create_circuit(self):
         """
@@ -126,9 +165,9 @@ class QFTMultiplier:
         """
         If debug is True, show the final circuit using matplotlib.
         """
-        if self.debug:
-            from IPython.display import display
-            display(self.multiplier_circuit.draw('mpl'))
+        if not self.debug:
+            return
+        _debug_draw(self.multiplier_circuit)
 
     def _insert_barrier(self):
         """
@@ -141,13 +180,13 @@ class QFTMultiplier:
         """
         Create the QFT gate for the target register Y.
         """
-        return QFTGate(num_qubits=self.Y_reg.size).build()
+        return _cached_qft_gate(self.Y_reg.size, inverse=False)
 
     def _create_iqft_gate(self):
         """
         Create the inverse QFT gate for the target register Y.
         """
-        return QFTGate(num_qubits=self.Y_reg.size, inverse=True).build()
+        return _cached_qft_gate(self.Y_reg.size, inverse=True)
 
     def _apply_qft(self):
         """
@@ -168,36 +207,54 @@ class QFTMultiplier:
         iqft_gate = self._create_iqft_gate()
         self.multiplier_circuit.append(iqft_gate, self.Y_reg)
 
-    def _create_C_ADD(self):
+    def _create_C_ADD(self, scale: int = 1):
         """
         Create a controlled QFT adder or subtractor:
-            |Y⟩|M⟩ → |Y ± M⟩  (in Fourier basis), controlled on one qubit.
+            |Y⟩|M⟩ → |Y ± scale·M⟩  (in Fourier basis), controlled on one qubit.
 
-        The operation performed depends on `self.inverse`.
+        The operation performed depends on `self.inverse`. Gates are cached per `scale`,
+        so repeated requests for the same weight return the same gate object.
+
+        With `use_diagonal=True` the gate is a single `DiagonalGate` acting on (Y, M)
+        followed by the control qubit, rather than a controlled gate with the control first.
+
+        Parameters
+        ----------
+        scale : int, optional
+            Binary weight 2^i of the controlling bit N[i]. Default is 1.
 
         Returns
         -------
-        ControlledGate
+        ControlledGate or DiagonalGate
             The controlled gate to apply conditionally on N[i].
         """
-        adder_gate = QFTAdder(target=self.Y_reg, operand=self.M_reg, inverse=self.inverse, skip_qft=True).build().to_gate()
-        return adder_gate.control()
+        if scale not in self._c_add_gates:
+            adder = QFTAdder(target=self.Y_reg, operand=self.M_reg, inverse=self.inverse, skip_qft=True, scale=scale, precision=self.precision)
+            if self.use_diagonal:
+                self._c_add_gates[scale] = adder.build_diagonal(controlled=True)
+            else:
+                self._c_add_gates[scale] = adder.build().to_gate().control()
+        return self._c_add_gates[scale]
 
     def _apply_C_ADD(self):
         """
         Apply controlled QFT additions to the accumulator Y based on the multiplier N.
     
         For each bit i of N:
-            - If N[i] is |1⟩, apply the adder 2^i times to simulate binary-weighted addition.
-            - This is done via repeated controlled application of the same gate.
+            - If N[i] is |1⟩, add M weighted by 2^i to the accumulator.
+            - The weight is folded into the adder's phase angles (CP(θ)^(2^i) = CP(2^i·θ)),
+              so each bit needs a single controlled adder instead of 2^i repetitions.
     
         This phase-accumulation model is fully quantum-compatible and operates in the Fourier domain.
         """
-        c_add_gate = self._create_C_ADD()
-        
+        y_m_qubits = list(self.Y_reg) + list(self.M_reg)
+
         for i in range(self.N_reg.size):
-            for j in range(2**i):
-                self.multiplier_circuit.append(c_add_gate, [self.N_reg[i]] + list(self.Y_reg) + list(self.M_reg))
+            c_add_gate = self._create_C_ADD(scale=2**i)
+            if self.use_diagonal:
+                self.multiplier_circuit.append(c_add_gate, [*y_m_qubits, self.N_reg[i]])
+            else:
+                self.multiplier_circuit.append(c_add_gate, [self.N_reg[i], *y_m_qubits])
             self._insert_barrier()
 
     def build(self):
@@ -206,7 +263,7 @@ class QFTMultiplier:
     
         Applies:
             1. QFT on target register Y
-            2. Repeated controlled additions of M, controlled by bits of N
+            2. Weighted controlled additions of M, one per bit of N
             3. Inverse QFT to return to the computational basis
     
         Returns
@@ -215,9 +272,64 @@ class QFTMultiplier:
             The completed multiplier circuit implementing Y += M × N.
         """
         self._create_circuit()
-        self._apply_qft()
-        self._apply_C_ADD()
-        self._apply_iqft()
+        if self.skip_qft:
+            self._apply_C_ADD()
+        else:
+            self._apply_qft()
+            self._apply_C_ADD()
+            self._apply_iqft()
+        self._debug_display()
+
+        return self.multiplier_circuit
+
+    def _fused_matrix(self) -> np.ndarray:
+        """
+        Compute the dense permutation matrix of the full multiplier.
+
+        Maps each basis state |y⟩|m⟩|n⟩ to |(y ± m·n) mod 2^|Y|⟩|m⟩|n⟩, using Qiskit's
+        little-endian ordering with Y on the low-order qubits, then M, then N.
+        """
+        n_Y, n_M = self.Y_reg.size, self.M_reg.size
+        dim = 2 ** (n_Y + n_M + self.N_reg.size)
+        y_mask = (1 << n_Y) - 1
+
+        index = np.arange(dim)
+        y = index & y_mask
+        m = (index >> n_Y) & ((1 << n_M) - 1)
+        n = index >> (n_Y + n_M)
+        product = -(m * n) if self.inverse else m * n
+        image = ((y + product) & y_mask) | (index & ~y_mask)
+
+        matrix = np.zeros((dim, dim), dtype=complex)
+        matrix[image, index] = 1.0
+        return matrix
+
+    def build_fused(self, max_qubits: int = 10):
+        """
+        Construct the multiplier as a single dense `UnitaryGate` on small registers.
+
+        When |Y| + |M| + |N| ≤ `max_qubits`, the whole QFT → controlled additions → iQFT
+        pipeline is replaced by its exact permutation matrix, computed once with NumPy.
+        Otherwise, or when `skip_qft=True` or `precision > 0` (where the circuit is not the
+        plain computational-basis product), this falls back to `build()`.
+
+        Parameters
+        ----------
+        max_qubits : int, optional
+            Largest total register width to fuse. Default is 10 (a 1024×1024 matrix).
+
+        Returns
+        -------
+        QuantumCircuit
+            Circuit implementing Y ← Y ± M × N.
+        """
+        total_qubits = self.Y_reg.size + self.M_reg.size + self.N_reg.size
+        if total_qubits > max_qubits or self.skip_qft or self.precision > 0:
+            return self.build()
+
+        self._create_circuit()
+        fused_gate = UnitaryGate(self._fused_matrix(), label=self.label)
+        self.multiplier_circuit.append(fused_gate, self.multiplier_circuit.qubits)
         self._debug_display()
 
-        return self.multiplier_circuit
\ No newline at end of file
+        return self.multiplier_circuit
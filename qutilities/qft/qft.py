@@ -1,6 +1,15 @@
+from functools import lru_cache
+import numpy as np
 from qiskit import QuantumCircuit
 from qiskit.circuit import Gate
-from math import pi
+from qiskit.circuit.library import UnitaryGate
+from math import ldexp, pi
+from qutilities._debug import _debug_draw
+
+# QFTs used internally by the arithmetic modules on at most this many qubits are emitted as
+# a single dense UnitaryGate instead of H/CP gates. Useful for statevector simulation of small
+# registers; dense unitaries transpile poorly to hardware, so this is disabled (0) by default.
+FUSE_THRESHOLD = 0
 
 class QFT:
     def __init__(
@@ -40,6 +49,9 @@ class QFT:
         if self.label is None:
             self.label = f"QFT ({self.qft_qubits})" if not self.inverse else f"QFT† ({self.qft_qubits})"
 
+        # CP rotation angles π / 2^d, indexed by qubit distance d
+        self._angle_table = [ldexp(pi, -distance) for distance in range(self.qft_qubits)]
+
     def _qubit_range(self):
         '''
         Determines the processing order of qubits. For inverse QFT, we apply gates from lowest to highest index.
@@ -88,8 +100,9 @@ class QFT:
         Displays the circuit using matplotlib if debug mode is enabled.
         This is useful for visually verifying circuit structure during development.
         '''
-        if self.debug:
-            display(circuit.draw('mpl'))
+        if not self.debug:
+            return
+        _debug_draw(circuit)
 
     def _init_circuit(self):
         """
@@ -147,7 +160,7 @@ class QFT:
                 if self._should_approximate(distance):
                     continue  # Skip gate if approximation threshold exceeded
 
-                angle = pi / (2 ** distance)  # Calculate CP gate rotation angle
+                angle = self._angle_table[distance]  # Look up CP gate rotation angle
                 if self.inverse:
                     angle = -angle  # Negate for inverse QFT
                     self.qft_circuit.cp(angle, target_qubit, control_qubit)
@@ -242,3 +255,42 @@ class QFTGate:
         """
         qft_circuit = self.qft.build()
         return qft_circuit.to_gate(label=self.qft.label)
+
+
+@lru_cache(maxsize=None)
+def _qft_matrix(num_qubits: int, inverse: bool = False) -> np.ndarray:
+    """
+    Return the dense matrix of `QFT(num_qubits, inverse=inverse)` (without swaps).
+
+    The swapped QFT is F[k, j] = exp(2πi·jk / 2^n) / √(2^n); without swaps the output
+    is bit-reversed, i.e. R·F for the forward and (R·F)† = F†·R for the inverse transform.
+    """
+    dim = 2 ** num_qubits
+    index = np.arange(dim)
+    fourier = np.exp(2j * np.pi * np.outer(index, index) / dim) / np.sqrt(dim)
+    reversed_index = np.array([int(format(k, f'0{num_qubits}b')[::-1], 2) for k in index])
+    matrix = fourier[reversed_index]
+    return matrix.conj().T if inverse else matrix
+
+
+@lru_cache(maxsize=None)
+def _build_qft_gate(num_qubits: int, inverse: bool, fused: bool) -> Gate:
+    """
+    Build the (inverse) QFT gate once per `(num_qubits, inverse, fused)` combination.
+    """
+    if fused:
+        label = f"QFT ({num_qubits})" if not inverse else f"QFT† ({num_qubits})"
+        return UnitaryGate(_qft_matrix(num_qubits, inverse), label=label)
+    return QFTGate(num_qubits=num_qubits, inverse=inverse).build()
+
+
+def _cached_qft_gate(num_qubits: int, inverse: bool = False) -> Gate:
+    """
+    Return an (inverse) QFT gate for the given register size.
+
+    The O(n²) QFT synthesis runs once per `(num_qubits, inverse)` pair; each call returns a
+    shallow copy of the cached gate, so mutating an operation in one circuit (e.g. its label)
+    does not leak into later builds. Registers of at most `FUSE_THRESHOLD` qubits get a
+    dense `UnitaryGate` instead.
+    """
+    return _build_qft_gate(num_qubits, inverse, num_qubits <= FUSE_THRESHOLD).copy()
@@ -2,7 +2,7 @@ from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
 from qiskit.circuit import Gate
 from qutilities.qft import QFT
 from math import pi
-from IPython.display import display
+from qutilities._debug import _debug_draw
 
 class QPE:
     def __init__(
@@ -150,6 +150,12 @@ class QPE:
         """Measure control register qubits into classical bits."""
         self.qpe_circuit.measure(self.control_reg, self.c_reg)
 
+    def _debug_display(self):
+        """Display the circuit using matplotlib if debug mode is enabled."""
+        if not self.debug:
+            return
+        _debug_draw(self.qpe_circuit)
+
     def build(self):
         """Assemble and return the full Quantum Phase Estimation circuit."""
         self._create_registers()
@@ -163,9 +169,7 @@ class QPE:
         self._add_barrier()
         
         self._measure()
-
-        if self.debug:
-            display(self.qpe_circuit.draw('mpl'))
+        self._debug_display()
 
         return self.qpe_circuit
 